@@ -0,0 +1,160 @@
+"""Micro-batching of /solve requests in front of the solver process pool."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from worker import solve_payload
+
+logger = logging.getLogger("solver_service")
+
+
+class SolveBatcher:
+    """Collects requests for a short window and dispatches them as one batch.
+
+    Byte-identical payloads within a batch (client retries, duplicate
+    submissions) are solved once and the result is fanned out to every
+    waiter. Distinct payloads are submitted to the pool in parallel, with at
+    most ``max_concurrency`` solves in flight so the pool is never oversubscribed.
+
+    The batcher owns the pool: once it reports a dead worker the pool is
+    replaced with one built by ``pool_factory``. Solves that were in flight on
+    the broken pool fail instead of being retried, since any of them may be
+    the payload that killed the worker.
+    """
+
+    def __init__(
+        self,
+        pool_factory: Callable[[], ProcessPoolExecutor],
+        max_batch_size: int,
+        window_seconds: float,
+        max_concurrency: int,
+    ):
+        self._pool_factory = pool_factory
+        self._pool = pool_factory()
+        self._pool_available = True
+        self._pool_restarts = 0
+        self._max_batch_size = max_batch_size
+        self._window_seconds = window_seconds
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._queue: asyncio.Queue[Tuple[bytes, asyncio.Future[bytes]]] = asyncio.Queue()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._solves: Set[asyncio.Task[None]] = set()
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Requests submitted but not yet answered, queued or solving."""
+        return self._pending
+
+    @property
+    def pool_available(self) -> bool:
+        """False while a broken pool could not be replaced."""
+        return self._pool_available
+
+    @property
+    def pool_restarts(self) -> int:
+        """How many times a broken pool has been replaced."""
+        return self._pool_restarts
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._pool.shutdown(cancel_futures=True)
+
+    async def submit(self, body: bytes) -> bytes:
+        future: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
+        self._pending += 1
+        try:
+            await self._queue.put((body, future))
+            return await future
+        finally:
+            self._pending -= 1
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            groups: Dict[bytes, List[asyncio.Future[bytes]]] = {}
+            for body, future in batch:
+                groups.setdefault(body, []).append(future)
+            for body, waiters in groups.items():
+                task = asyncio.get_running_loop().create_task(self._solve(body, waiters))
+                self._solves.add(task)
+                task.add_done_callback(self._solves.discard)
+
+    async def _collect(self) -> List[Tuple[bytes, asyncio.Future[bytes]]]:
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self._window_seconds
+        while len(batch) < self._max_batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _solve(self, body: bytes, waiters: List[asyncio.Future[bytes]]) -> None:
+        try:
+            async with self._slots:
+                if all(waiter.done() for waiter in waiters):  # every caller went away while queued
+                    return
+                result = await self._run_in_pool(body)
+        except Exception as exc:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(exc)
+        else:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(result)
+
+    async def _run_in_pool(self, body: bytes) -> bytes:
+        loop = asyncio.get_running_loop()
+        pool = self._pool
+        try:
+            # run_in_executor submits synchronously, so a pool that broke while idle raises here
+            future = loop.run_in_executor(pool, solve_payload, body)
+        except BrokenProcessPool:
+            # This payload never reached a worker, so it is safe to run on a fresh pool
+            pool = self._replace_pool(pool)
+            future = loop.run_in_executor(pool, solve_payload, body)
+        try:
+            return await future
+        except BrokenProcessPool:
+            # A worker died (OOM kill, native crash) while this solve was in flight. It may be
+            # the cause, so it is not retried; /solve answers 503 and later requests get a new pool.
+            self._replace_pool(pool)
+            raise
+
+    def _replace_pool(self, broken: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        # Concurrent solves all see the same broken pool; only the first one replaces it
+        if self._pool is not broken:
+            return self._pool
+        logger.warning("Solver process pool broken; starting a new one")
+        broken.shutdown(wait=False, cancel_futures=True)
+        try:
+            self._pool = self._pool_factory()
+        except Exception:
+            # Keep the broken pool so the next submit raises BrokenProcessPool and tries again
+            self._pool_available = False
+            logger.exception("Could not start a new solver process pool")
+            raise BrokenProcessPool("Solver process pool could not be restarted") from None
+        self._pool_available = True
+        self._pool_restarts += 1
+        return self._pool
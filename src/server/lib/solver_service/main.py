@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict
-
-from fastapi import FastAPI, HTTPException
-
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict
+
+import msgspec
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import JSONResponse
+
+from batching import SolveBatcher
 from models import ErrorResponse, SolverConfig, SolverRequest, SolverResponse
-from solver import OrToolsSolver, SolverError
+from solver import SolverError
+from worker import init_worker
 
 try:  # pragma: no cover - optional runtime metadata
     from ortools import __version__ as ortools_version
@@ -18,45 +27,132 @@ except ImportError:  # pragma: no cover - defensive fallback
 
 logger = logging.getLogger("solver_service")
 
+
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
 app = FastAPI(
     title="Generic OR-Tools Solver",
     description="Minimal microservice that exposes CP-SAT solving over HTTP",
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=OrjsonResponse,
+)
+
+(_request_schema,), _request_components = msgspec.json.schema_components(
+    [SolverRequest], ref_template="#/components/schemas/{name}"
 )
 
 
+def custom_openapi() -> Dict[str, Any]:
+    if app.openapi_schema is None:
+        schema = FastAPI.openapi(app)
+        schema.setdefault("components", {}).setdefault("schemas", {}).update(_request_components)
+    return app.openapi_schema
+
+
+app.openapi = custom_openapi  # type: ignore[method-assign]
+
+
+def create_pool(config: SolverConfig) -> ProcessPoolExecutor:
+    # Spawned (not forked) workers so children never inherit the running event loop.
+    return ProcessPoolExecutor(
+        max_workers=config.pool_size,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker,
+        initargs=(config,),
+    )
+
+
 @app.on_event("startup")
 async def startup_event() -> None:
     config = SolverConfig.from_env()
     app.state.config = config
-    app.state.solver = OrToolsSolver(config)
+    app.state.batcher = SolveBatcher(
+        lambda: create_pool(config),
+        max_batch_size=config.batch_max_size,
+        window_seconds=config.batch_window_ms / 1000,
+        max_concurrency=config.pool_size,
+    )
+    app.state.batcher.start()
     logger.info(
         "Solver service initialised",
-        extra={"timeout_seconds": config.max_time_seconds, "num_workers": config.num_workers},
+        extra={
+            "timeout_seconds": config.max_time_seconds,
+            "num_workers": config.num_workers,
+            "pool_size": config.pool_size,
+        },
     )
 
 
-@app.post("/solve", response_model=SolverResponse, responses={400: {"model": ErrorResponse}})
-async def solve(request: SolverRequest) -> SolverResponse:
-    solver: OrToolsSolver = app.state.solver
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    await app.state.batcher.stop()
+
+
+@app.post(
+    "/solve",
+    response_model=None,
+    responses={
+        200: {"model": SolverResponse},
+        400: {"model": ErrorResponse},
+        422: {"model": ErrorResponse},
+        503: {"model": ErrorResponse},
+    },
+    openapi_extra={
+        "requestBody": {"required": True, "content": {"application/json": {"schema": _request_schema}}}
+    },
+)
+async def solve(request: Request) -> Response:
+    config: SolverConfig = app.state.config
+    batcher: SolveBatcher = app.state.batcher
+    if batcher.pending >= config.max_pending:
+        # Shed load instead of letting the backlog grow until every request times out
+        raise HTTPException(
+            status_code=503,
+            detail={"error": "overloaded", "details": f"{batcher.pending} solve requests already pending"},
+            headers={"Retry-After": str(math.ceil(config.max_time_seconds))},
+        )
     try:
-        result = solver.solve(request)
-        return result
+        result = await batcher.submit(await request.body())
+        # Already serialised by the worker; wrap without re-encoding.
+        return Response(content=result, media_type="application/json")
+    except BrokenProcessPool as exc:
+        raise HTTPException(
+            status_code=503,
+            detail={"error": "solver_unavailable", "details": "Solver worker process died"},
+            headers={"Retry-After": "1"},
+        ) from exc
+    except msgspec.DecodeError as exc:
+        raise HTTPException(status_code=422, detail={"error": "invalid_request", "details": str(exc)}) from exc
     except SolverError as exc:
-        logger.warning("Solver rejected request", extra={"error": str(exc)})
-        raise HTTPException(status_code=400, detail={"error": "invalid_model", "details": str(exc)}) from exc
+        details = str(exc)
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("Solver rejected request: %s", details)
+        raise HTTPException(status_code=400, detail={"error": "invalid_model", "details": details}) from exc
 
 
-@app.get("/health")
+@app.get("/health", responses={503: {"model": ErrorResponse}})
 async def health() -> Dict[str, object]:
     config: SolverConfig = app.state.config
+    batcher: SolveBatcher = app.state.batcher
+    if not batcher.pool_available:
+        raise HTTPException(
+            status_code=503,
+            detail={"error": "solver_unavailable", "details": "Solver process pool could not be restarted"},
+        )
     return {
         "status": "ok",
         "ortools_version": ortools_version,
         "timeout_seconds": config.max_time_seconds,
         "num_workers": config.num_workers,
+        "pool_size": config.pool_size,
+        "pool_restarts": batcher.pool_restarts,
     }
 
 
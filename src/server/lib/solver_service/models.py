@@ -1,71 +1,98 @@
-"""Pydantic models for the OR-Tools solver microservice."""
+"""Request and response models for the OR-Tools solver microservice.
+
+Incoming requests are decoded straight from JSON into msgspec structs; the
+configuration and response models remain Pydantic models.
+"""
 
 from __future__ import annotations
 
 import os
-from typing import Dict, List, Literal, Optional, Union
+from typing import Annotated, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field
 
 
 SolverStatus = Literal["OPTIMAL", "FEASIBLE", "INFEASIBLE", "UNKNOWN"]
 
+# Output-only models: the solver returns plain dicts, so these only back the
+# OpenAPI docs and their schemas are built on first use rather than at import.
+OUTPUT_MODEL_CONFIG = ConfigDict(defer_build=True, extra="ignore", populate_by_name=False, frozen=True)
+
 
 class SolverConfig(BaseModel):
     """Runtime configuration loaded from environment variables."""
 
     max_time_seconds: float = Field(5.0, gt=0.0, description="CP-SAT time limit in seconds")
     num_workers: int = Field(4, ge=1, le=64, description="Number of search workers")
+    pool_size: int = Field(1, ge=1, description="Number of solver processes handling requests")
+    http_workers: int = Field(1, ge=1, description="Number of HTTP worker processes, each with its own pool")
+    batch_max_size: int = Field(16, ge=1, description="Maximum requests collected into one batch")
+    batch_window_ms: float = Field(5.0, ge=0.0, description="How long a batch waits for more requests")
+    max_pending: int = Field(64, ge=1, description="Queued or running requests before /solve answers 503")
+    model_cache_size: int = Field(32, ge=0, description="Built models each solver process keeps for repeat requests")
 
     @classmethod
     def from_env(cls) -> "SolverConfig":
         timeout = float(os.getenv("SOLVER_TIMEOUT_SECONDS", cls.__fields__["max_time_seconds"].default))
         workers = int(os.getenv("SOLVER_NUM_WORKERS", cls.__fields__["num_workers"].default))
-        return cls(max_time_seconds=timeout, num_workers=workers)
-
-
-class IntVarModel(BaseModel):
+        http_workers = int(os.getenv("SOLVER_HTTP_WORKERS", cls.__fields__["http_workers"].default))
+        # Default to as many processes as fit on the machine without oversubscribing CP-SAT workers,
+        # split across the HTTP workers since each one starts its own pool
+        default_pool_size = max(1, (os.cpu_count() or 1) // (workers * http_workers))
+        pool_size = int(os.getenv("SOLVER_POOL_SIZE", default_pool_size))
+        batch_max_size = int(os.getenv("SOLVER_BATCH_MAX_SIZE", cls.__fields__["batch_max_size"].default))
+        batch_window_ms = float(os.getenv("SOLVER_BATCH_WINDOW_MS", cls.__fields__["batch_window_ms"].default))
+        max_pending = int(os.getenv("SOLVER_MAX_PENDING", cls.__fields__["max_pending"].default))
+        model_cache_size = int(os.getenv("SOLVER_MODEL_CACHE_SIZE", cls.__fields__["model_cache_size"].default))
+        return cls(
+            max_time_seconds=timeout,
+            num_workers=workers,
+            pool_size=pool_size,
+            http_workers=http_workers,
+            batch_max_size=batch_max_size,
+            batch_window_ms=batch_window_ms,
+            max_pending=max_pending,
+            model_cache_size=model_cache_size,
+        )
+
+
+class IntVarModel(msgspec.Struct, kw_only=True):
     id: str
-    min: int = Field(default=0)
+    min: int = 0
     max: int
 
-    @field_validator("max")
-    @classmethod
-    def validate_domain(cls, value: int, info) -> int:
-        min_value = info.data.get("min", 0)
-        if value < min_value:
-            raise ValueError(f"max must be >= min for variable {info.data.get('id')}")
-        return value
+    def __post_init__(self) -> None:
+        if self.max < self.min:
+            raise ValueError(f"max must be >= min for variable {self.id}")
 
 
-class BoolVarModel(BaseModel):
+class BoolVarModel(msgspec.Struct):
     id: str
 
 
-class LinearTerm(BaseModel):
+class LinearTerm(msgspec.Struct):
     var: str
     coefficient: int = 1
 
 
-class IntervalVarModel(BaseModel):
+class IntervalVarModel(msgspec.Struct, kw_only=True):
     id: str
     start_var: str
-    duration: int = Field(..., gt=0)
+    duration: Annotated[int, msgspec.Meta(gt=0)]
     end_var: Optional[str] = None
     optional: bool = False
     presence_var: Optional[str] = None
 
-    @model_validator(mode="after")
-    def validate_presence(self) -> "IntervalVarModel":
+    def __post_init__(self) -> None:
         if self.optional:
             # Allow auto-created presence variable if not provided
-            return self
+            return
         if self.presence_var is not None:
             raise ValueError("presence_var is only valid for optional intervals")
-        return self
 
 
-class ConstraintModel(BaseModel):
+class ConstraintModel(msgspec.Struct, kw_only=True):
     type: Literal["no_overlap", "less_equal", "greater_equal", "equal", "sum_equal", "bool_or"]
     left: Optional[str] = None
     right: Optional[Union[int, str]] = None
@@ -75,8 +102,7 @@ class ConstraintModel(BaseModel):
     literals: Optional[List[str]] = None
     condition: Optional[str] = None
 
-    @model_validator(mode="after")
-    def check_required_fields(self) -> "ConstraintModel":
+    def __post_init__(self) -> None:
         constraint_type = self.type
         if constraint_type == "no_overlap" and not self.intervals:
             raise ValueError("no_overlap constraints require 'intervals'")
@@ -92,42 +118,45 @@ class ConstraintModel(BaseModel):
                 raise ValueError("sum_equal constraints require 'equals'")
         if constraint_type == "bool_or" and not self.literals:
             raise ValueError("bool_or constraints require 'literals'")
-        return self
 
 
-class ObjectiveModel(BaseModel):
+class ObjectiveModel(msgspec.Struct):
     type: Literal["maximize", "minimize"]
     terms: List[LinearTerm]
 
 
-class SolverRequest(BaseModel):
-    variables: List[IntVarModel] = Field(default_factory=list)
-    bool_variables: List[BoolVarModel] = Field(default_factory=list)
-    intervals: List[IntervalVarModel] = Field(default_factory=list)
-    constraints: List[ConstraintModel] = Field(default_factory=list)
+class SolverRequest(msgspec.Struct, kw_only=True):
+    variables: List[IntVarModel] = msgspec.field(default_factory=list)
+    # Accepts bare ids as shorthand; normalised to BoolVarModel after decoding
+    bool_variables: Optional[List[Union[str, BoolVarModel]]] = msgspec.field(default_factory=list)
+    intervals: List[IntervalVarModel] = msgspec.field(default_factory=list)
+    constraints: List[ConstraintModel] = msgspec.field(default_factory=list)
     objective: Optional[ObjectiveModel] = None
 
-    @field_validator("bool_variables", mode="before")
-    @classmethod
-    def normalize_bool_vars(cls, value):
-        if value is None:
-            return []
-        if all(isinstance(item, str) for item in value):
-            return [{"id": item} for item in value]
-        return value
+    def __post_init__(self) -> None:
+        self.bool_variables = [
+            BoolVarModel(id=item) if isinstance(item, str) else item
+            for item in self.bool_variables or []
+        ]
 
 
 class VariableValue(BaseModel):
+    model_config = OUTPUT_MODEL_CONFIG
+
     id: str
     value: int
 
 
 class BoolValue(BaseModel):
+    model_config = OUTPUT_MODEL_CONFIG
+
     id: str
     value: bool
 
 
 class IntervalValue(BaseModel):
+    model_config = OUTPUT_MODEL_CONFIG
+
     id: str
     start: int
     end: int
@@ -135,6 +164,8 @@ class IntervalValue(BaseModel):
 
 
 class SolverResponse(BaseModel):
+    model_config = OUTPUT_MODEL_CONFIG
+
     status: SolverStatus
     objective_value: Optional[int] = None
     wall_time: float
@@ -144,7 +175,8 @@ class SolverResponse(BaseModel):
 
 
 class ErrorResponse(BaseModel):
+    model_config = OUTPUT_MODEL_CONFIG
+
     error: str
     details: Optional[str] = None
 
-
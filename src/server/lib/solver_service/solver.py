@@ -2,24 +2,22 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple, Union
+import operator
+from functools import partial
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple, Union
 
 from ortools.sat.python import cp_model
 
 from models import (
-    BoolValue,
     BoolVarModel,
     ConstraintModel,
     IntVarModel,
-    IntervalValue,
     IntervalVarModel,
     LinearTerm,
     ObjectiveModel,
     SolverConfig,
     SolverRequest,
-    SolverResponse,
     SolverStatus,
-    VariableValue,
 )
 
 
@@ -27,65 +25,172 @@ NEGATION_PREFIX = "!"
 DEFAULT_MIN = -10**9
 DEFAULT_MAX = 10**9
 
+COMPARISON_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "less_equal": operator.le,
+    "greater_equal": operator.ge,
+    "equal": operator.eq,
+}
+
 
 class SolverError(Exception):
     """Exception raised when the solver cannot build or solve a model."""
 
 
+class BuiltModel(NamedTuple):
+    """A constructed CP-SAT model plus the id registries needed to read a solution back.
+
+    Solving does not modify the model, so one instance can be solved repeatedly.
+    """
+
+    model: cp_model.CpModel
+    int_vars: Dict[str, cp_model.IntVar]
+    bool_vars: Dict[str, cp_model.BoolVar]
+    interval_vars: Dict[str, cp_model.IntervalVar]
+    interval_presence: Dict[str, cp_model.BoolVar]
+    has_objective: bool
+
+
 class OrToolsSolver:
-    """Encapsulates CP-SAT model construction and solving."""
+    """Encapsulates CP-SAT model construction and solving.
+
+    Instances hold a single ``CpSolver`` that is reused across requests, so an
+    instance must not be shared between threads. Each pool worker process owns
+    its own instance.
+    """
 
     def __init__(self, config: SolverConfig):
         self._config = config
+        self._cp_solver = cp_model.CpSolver()
+        self._cp_solver.parameters.max_time_in_seconds = config.max_time_seconds
+        self._cp_solver.parameters.num_search_workers = config.num_workers
+
+    def solve(self, request: SolverRequest) -> Dict[str, Any]:
+        """Build and solve ``request``; the result is a plain dict shaped like ``SolverResponse``."""
+        return self.solve_built(self.build(request))
 
-    def solve(self, request: SolverRequest) -> SolverResponse:
+    def build(self, request: SolverRequest) -> BuiltModel:
         model = cp_model.CpModel()
 
         int_vars: Dict[str, cp_model.IntVar] = {}
         bool_vars: Dict[str, cp_model.BoolVar] = {}
-        interval_vars: Dict[str, Tuple[cp_model.IntervalVar, Optional[cp_model.BoolVar]]] = {}
+        interval_vars: Dict[str, cp_model.IntervalVar] = {}
+        # Kept apart from interval_vars so no_overlap can use the interval table directly
+        interval_presence: Dict[str, cp_model.BoolVar] = {}
+        # Both polarities of every boolean ("x" and "!x"), filled as booleans are created,
+        # so parsing a literal is a single lookup
+        literals: Dict[str, cp_model.BoolVar] = {}
 
         try:
-            self._build_int_variables(model, request.variables, int_vars)
-            self._build_bool_variables(model, request.bool_variables, bool_vars)
-            self._build_intervals(model, request.intervals, int_vars, bool_vars, interval_vars)
-            self._apply_constraints(model, request.constraints, int_vars, bool_vars, interval_vars)
+            bounds, constraints = self._fold_unary_bounds(request.variables, request.constraints)
+            self._build_int_variables(model, request.variables, int_vars, bounds)
+            self._build_bool_variables(model, request.bool_variables, bool_vars, literals)
+            self._build_intervals(
+                model,
+                request.intervals,
+                int_vars,
+                bool_vars,
+                interval_vars,
+                interval_presence,
+                literals,
+                # References come from the request's own constraints: folded bounds still name their variable
+                self._referenced_var_ids(request.constraints, request.intervals, request.objective),
+            )
+            self._apply_constraints(model, constraints, int_vars, bool_vars, interval_vars, literals)
             self._configure_objective(model, request.objective, int_vars, bool_vars)
+        except SolverError:
+            raise
+        except Exception as exc:  # pragma: no cover - defensive programming
+            raise SolverError(str(exc)) from exc
 
-            solver = cp_model.CpSolver()
-            solver.parameters.max_time_in_seconds = self._config.max_time_seconds
-            solver.parameters.num_search_workers = self._config.num_workers
+        return BuiltModel(
+            model=model,
+            int_vars=int_vars,
+            bool_vars=bool_vars,
+            interval_vars=interval_vars,
+            interval_presence=interval_presence,
+            has_objective=request.objective is not None,
+        )
 
-            status_code = solver.Solve(model)
+    def solve_built(self, built: BuiltModel) -> Dict[str, Any]:
+        """Solve a model returned by :meth:`build`."""
+        try:
+            solver = self._cp_solver
+            status_code = solver.solve(built.model)
             status = self._map_status(status_code)
 
-            return self._build_response(status, solver, request, int_vars, bool_vars, interval_vars)
-        except SolverError:
-            raise
+            return self._build_response(status, solver, built)
         except Exception as exc:  # pragma: no cover - defensive programming
             raise SolverError(str(exc)) from exc
 
+    def _fold_unary_bounds(
+        self,
+        variables: List[IntVarModel],
+        constraints: List[ConstraintModel],
+    ) -> Tuple[Dict[str, Tuple[int, int]], List[ConstraintModel]]:
+        """Fold unconditional ``var <op> constant`` comparisons into variable domains.
+
+        Returns the tightened ``(min, max)`` per declared integer variable and the
+        constraints that still need to be added to the model. Variables whose
+        folded domain would be empty keep their constraints so CP-SAT reports the
+        model as infeasible.
+        """
+        declared: Dict[str, Tuple[int, int]] = {}
+        for var in variables:
+            declared.setdefault(var.id, (var.min, var.max))
+        bounds = dict(declared)
+
+        folded: Dict[str, List[ConstraintModel]] = {}
+        remaining: List[ConstraintModel] = []
+        for constraint in constraints:
+            var_id = constraint.left
+            bound = constraint.right
+            if (
+                constraint.condition
+                or constraint.type not in COMPARISON_OPERATORS
+                or var_id not in bounds
+                or not isinstance(bound, int)
+            ):
+                remaining.append(constraint)
+                continue
+            low, high = bounds[var_id]
+            if constraint.type != "less_equal":
+                low = max(low, bound)
+            if constraint.type != "greater_equal":
+                high = min(high, bound)
+            bounds[var_id] = (low, high)
+            folded.setdefault(var_id, []).append(constraint)
+
+        for var_id, var_constraints in folded.items():
+            low, high = bounds[var_id]
+            if low > high:
+                bounds[var_id] = declared[var_id]
+                remaining.extend(var_constraints)
+        return bounds, remaining
+
     def _build_int_variables(
         self,
         model: cp_model.CpModel,
         variables: List[IntVarModel],
         int_vars: Dict[str, cp_model.IntVar],
+        bounds: Dict[str, Tuple[int, int]],
     ) -> None:
         for var in variables:
             if var.id in int_vars:
                 raise SolverError(f"Duplicate integer variable id '{var.id}'")
-            int_vars[var.id] = model.NewIntVar(var.min, var.max, var.id)
+            low, high = bounds[var.id]
+            int_vars[var.id] = model.new_int_var(low, high, var.id)
 
     def _build_bool_variables(
         self,
         model: cp_model.CpModel,
         bool_variables: List[BoolVarModel],
         bool_vars: Dict[str, cp_model.BoolVar],
+        literals: Dict[str, cp_model.BoolVar],
     ) -> None:
         for var in bool_variables:
             if var.id in bool_vars:
                 raise SolverError(f"Duplicate boolean variable id '{var.id}'")
-            bool_vars[var.id] = model.NewBoolVar(var.id)
+            self._ensure_bool_var(model, var.id, bool_vars, literals)
 
     def _build_intervals(
         self,
@@ -93,28 +198,51 @@ class OrToolsSolver:
         intervals: List[IntervalVarModel],
         int_vars: Dict[str, cp_model.IntVar],
         bool_vars: Dict[str, cp_model.BoolVar],
-        interval_vars: Dict[str, Tuple[cp_model.IntervalVar, Optional[cp_model.BoolVar]]],
+        interval_vars: Dict[str, cp_model.IntervalVar],
+        interval_presence: Dict[str, cp_model.BoolVar],
+        literals: Dict[str, cp_model.BoolVar],
+        referenced: Set[str],
     ) -> None:
         for interval in intervals:
             start_var = self._require_int_var(model, interval.start_var, int_vars)
 
+            # The interval itself enforces end == start + duration, so no extra equality is added.
+            # Without a named end_var the end stays the expression start + duration, unless the
+            # start domain relies on the auto-created end's [duration, DEFAULT_MAX] bounds or the
+            # implicit "<id>_end" variable is visible to the caller: declared, already created, or
+            # named by a constraint, an objective term or another interval.
+            end_var = None
             end_var_id = interval.end_var or f"{interval.id}_end"
-            end_var = self._ensure_int_var(model, end_var_id, int_vars, interval.duration, DEFAULT_MAX)
+            if (
+                interval.end_var is not None
+                or end_var_id in int_vars
+                or end_var_id in referenced
+                or not self._fits_end_domain(start_var, interval.duration)
+            ):
+                end_var = self._ensure_int_var(model, end_var_id, int_vars, interval.duration, DEFAULT_MAX)
 
             if interval.optional:
-                presence = self._ensure_bool_var(model, interval.presence_var or f"{interval.id}_presence", bool_vars)
-                interval_var = model.NewOptionalIntervalVar(
-                    start_var, interval.duration, end_var, presence, interval.id
+                presence_id = interval.presence_var or f"{interval.id}_presence"
+                presence = interval_presence[interval.id] = self._ensure_bool_var(
+                    model, presence_id, bool_vars, literals
                 )
-                model.Add(end_var == start_var + interval.duration).OnlyEnforceIf(presence)
+                if end_var is None:
+                    interval_var = model.new_optional_fixed_size_interval_var(
+                        start_var, interval.duration, presence, interval.id
+                    )
+                else:
+                    interval_var = model.new_optional_interval_var(
+                        start_var, interval.duration, end_var, presence, interval.id
+                    )
             else:
                 if interval.presence_var:
                     raise SolverError(f"Interval '{interval.id}' is not optional but presence_var was provided")
-                interval_var = model.NewIntervalVar(start_var, interval.duration, end_var, interval.id)
-                model.Add(end_var == start_var + interval.duration)
-                presence = None
+                if end_var is None:
+                    interval_var = model.new_fixed_size_interval_var(start_var, interval.duration, interval.id)
+                else:
+                    interval_var = model.new_interval_var(start_var, interval.duration, end_var, interval.id)
 
-            interval_vars[interval.id] = (interval_var, presence)
+            interval_vars[interval.id] = interval_var
 
     def _apply_constraints(
         self,
@@ -122,21 +250,26 @@ class OrToolsSolver:
         constraints: List[ConstraintModel],
         int_vars: Dict[str, cp_model.IntVar],
         bool_vars: Dict[str, cp_model.BoolVar],
-        interval_vars: Dict[str, Tuple[cp_model.IntervalVar, Optional[cp_model.BoolVar]]],
+        interval_vars: Dict[str, cp_model.IntervalVar],
+        literals: Dict[str, cp_model.BoolVar],
     ) -> None:
+        # Constraint type -> handler, looked up once per constraint instead of an if/elif chain.
+        # Each handler is bound to just the registries it reads, so the dispatch call stays uniform.
+        comparison = partial(self._constraint_comparison, int_vars=int_vars, bool_vars=bool_vars)
+        handlers: Dict[str, Callable[..., None]] = {
+            "no_overlap": partial(self._constraint_no_overlap, interval_vars=interval_vars),
+            "less_equal": comparison,
+            "greater_equal": comparison,
+            "equal": comparison,
+            "sum_equal": partial(self._constraint_sum_equal, int_vars=int_vars, bool_vars=bool_vars),
+            "bool_or": partial(self._constraint_bool_or, literals=literals),
+        }
         for constraint in constraints:
-            condition_literals = self._parse_condition(constraint.condition, bool_vars)
-
-            if constraint.type == "no_overlap":
-                self._constraint_no_overlap(model, constraint, interval_vars)
-            elif constraint.type in {"less_equal", "greater_equal", "equal"}:
-                self._constraint_comparison(model, constraint, int_vars, bool_vars, condition_literals)
-            elif constraint.type == "sum_equal":
-                self._constraint_sum_equal(model, constraint, int_vars, bool_vars, condition_literals)
-            elif constraint.type == "bool_or":
-                self._constraint_bool_or(model, constraint, bool_vars, condition_literals)
-            else:  # pragma: no cover - exhaustive guard
+            handler = handlers.get(constraint.type)
+            if handler is None:  # pragma: no cover - exhaustive guard
                 raise SolverError(f"Unsupported constraint type '{constraint.type}'")
+            condition_literals = self._parse_condition(constraint.condition, literals)
+            handler(model, constraint, condition_literals)
 
     def _configure_objective(
         self,
@@ -148,51 +281,44 @@ class OrToolsSolver:
         if not objective:
             return
 
-        expr = None
-        for term in objective.terms:
-            var = self._get_linear_term_var(term.var, int_vars, bool_vars)
-            term_expr = term.coefficient * var
-            expr = term_expr if expr is None else expr + term_expr
-
-        if expr is None:
+        if not objective.terms:
             raise SolverError("Objective must contain at least one term")
 
+        # weighted_sum builds the expression in one call instead of one temporary per term
+        expr = cp_model.LinearExpr.weighted_sum(
+            [self._get_linear_term_var(term.var, int_vars, bool_vars) for term in objective.terms],
+            [term.coefficient for term in objective.terms],
+        )
+
         if objective.type == "maximize":
-            model.Maximize(expr)
+            model.maximize(expr)
         else:
-            model.Minimize(expr)
+            model.minimize(expr)
 
     def _build_response(
         self,
         status: SolverStatus,
         solver: cp_model.CpSolver,
-        request: SolverRequest,
-        int_vars: Dict[str, cp_model.IntVar],
-        bool_vars: Dict[str, cp_model.BoolVar],
-        interval_vars: Dict[str, Tuple[cp_model.IntervalVar, Optional[cp_model.BoolVar]]],
-    ) -> SolverResponse:
+        built: BuiltModel,
+    ) -> Dict[str, Any]:
+        # Plain dicts in registry (insertion) order go straight to orjson without a model layer.
         if status in ("OPTIMAL", "FEASIBLE"):
-            variables = [
-                VariableValue(id=var_id, value=solver.Value(var))
-                for var_id, var in sorted(int_vars.items())
-            ]
+            variables = [{"id": var_id, "value": solver.value(var)} for var_id, var in built.int_vars.items()]
             bools = [
-                BoolValue(id=var_id, value=bool(solver.Value(var)))
-                for var_id, var in sorted(bool_vars.items())
+                {"id": var_id, "value": bool(solver.value(var))} for var_id, var in built.bool_vars.items()
             ]
             intervals = []
-            for interval_id, (interval_var, presence_var) in interval_vars.items():
+            for interval_id, interval_var in built.interval_vars.items():
                 present = True
+                presence_var = built.interval_presence.get(interval_id)
                 if presence_var is not None:
-                    present = bool(solver.Value(presence_var))
-                start = solver.Value(interval_var.StartExpr()) if present else 0
-                end = solver.Value(interval_var.EndExpr()) if present else 0
-                intervals.append(
-                    IntervalValue(id=interval_id, start=start, end=end, presence=present)
-                )
+                    present = bool(solver.value(presence_var))
+                start = solver.value(interval_var.start_expr()) if present else 0
+                end = solver.value(interval_var.end_expr()) if present else 0
+                intervals.append({"id": interval_id, "start": start, "end": end, "presence": present})
             objective_value = (
-                int(solver.ObjectiveValue())
-                if request.objective and status in ("OPTIMAL", "FEASIBLE")
+                int(solver.objective_value)
+                if built.has_objective and status in ("OPTIMAL", "FEASIBLE")
                 else None
             )
         else:
@@ -201,23 +327,24 @@ class OrToolsSolver:
             intervals = []
             objective_value = None
 
-        return SolverResponse(
-            status=status,
-            objective_value=objective_value,
-            wall_time=solver.WallTime(),
-            variables=variables,
-            bool_variables=bools,
-            intervals=intervals,
-        )
+        return {
+            "status": status,
+            "objective_value": objective_value,
+            "wall_time": solver.wall_time,
+            "variables": variables,
+            "bool_variables": bools,
+            "intervals": intervals,
+        }
 
     def _constraint_no_overlap(
         self,
         model: cp_model.CpModel,
         constraint: ConstraintModel,
-        interval_vars: Dict[str, Tuple[cp_model.IntervalVar, Optional[cp_model.BoolVar]]],
+        condition_literals: List[cp_model.BoolVar],
+        interval_vars: Dict[str, cp_model.IntervalVar],
     ) -> None:
         try:
-            model.AddNoOverlap([interval_vars[i][0] for i in constraint.intervals or []])
+            model.add_no_overlap(map(interval_vars.__getitem__, constraint.intervals or []))
         except KeyError as exc:
             raise SolverError(f"Interval '{exc.args[0]}' referenced before definition") from exc
 
@@ -225,72 +352,67 @@ class OrToolsSolver:
         self,
         model: cp_model.CpModel,
         constraint: ConstraintModel,
+        condition_literals: List[cp_model.BoolVar],
         int_vars: Dict[str, cp_model.IntVar],
         bool_vars: Dict[str, cp_model.BoolVar],
-        condition_literals: List[cp_model.BoolVar],
     ) -> None:
         left = self._resolve_linear_operand(constraint.left, int_vars, bool_vars)
         right = self._resolve_linear_operand(constraint.right, int_vars, bool_vars)
 
-        if constraint.type == "less_equal":
-            ct = model.Add(left <= right)
-        elif constraint.type == "greater_equal":
-            ct = model.Add(left >= right)
-        else:
-            ct = model.Add(left == right)
+        ct = model.add(COMPARISON_OPERATORS[constraint.type](left, right))
 
         for literal in condition_literals:
-            ct.OnlyEnforceIf(literal)
+            ct.only_enforce_if(literal)
 
     def _constraint_sum_equal(
         self,
         model: cp_model.CpModel,
         constraint: ConstraintModel,
+        condition_literals: List[cp_model.BoolVar],
         int_vars: Dict[str, cp_model.IntVar],
         bool_vars: Dict[str, cp_model.BoolVar],
-        condition_literals: List[cp_model.BoolVar],
     ) -> None:
-        expr = sum(
-            (term.coefficient or 1)
-            * self._get_linear_term_var(term.var, int_vars, bool_vars)
-            for term in constraint.terms or []
+        terms = constraint.terms or []
+        expr = cp_model.LinearExpr.weighted_sum(
+            [self._get_linear_term_var(term.var, int_vars, bool_vars) for term in terms],
+            [term.coefficient for term in terms],
         )
-        ct = model.Add(expr == int(constraint.equals))
+        ct = model.add(expr == int(constraint.equals))
         for literal in condition_literals:
-            ct.OnlyEnforceIf(literal)
+            ct.only_enforce_if(literal)
 
     def _constraint_bool_or(
         self,
         model: cp_model.CpModel,
         constraint: ConstraintModel,
-        bool_vars: Dict[str, cp_model.BoolVar],
         condition_literals: List[cp_model.BoolVar],
+        literals: Dict[str, cp_model.BoolVar],
     ) -> None:
-        literals = [self._parse_literal(lit, bool_vars) for lit in constraint.literals or []]
-        ct = model.AddBoolOr(literals)
+        clause = [self._parse_literal(lit, literals) for lit in constraint.literals or []]
+        ct = model.add_bool_or(clause)
         for literal in condition_literals:
-            ct.OnlyEnforceIf(literal)
+            ct.only_enforce_if(literal)
 
     def _parse_condition(
         self,
         condition: Optional[str],
-        bool_vars: Dict[str, cp_model.BoolVar],
+        literals: Dict[str, cp_model.BoolVar],
     ) -> List[cp_model.BoolVar]:
         if not condition:
             return []
-        literal = self._parse_literal(condition, bool_vars)
+        literal = self._parse_literal(condition, literals)
         return [literal]
 
     def _parse_literal(
         self,
         literal: str,
-        bool_vars: Dict[str, cp_model.BoolVar],
+        literals: Dict[str, cp_model.BoolVar],
     ) -> cp_model.BoolVar:
-        is_negated = literal.startswith(NEGATION_PREFIX)
-        var_id = literal[1:] if is_negated else literal
-        if var_id not in bool_vars:
+        parsed = literals.get(literal)
+        if parsed is None:
+            var_id = literal[1:] if literal.startswith(NEGATION_PREFIX) else literal
             raise SolverError(f"Boolean variable '{var_id}' referenced before definition")
-        return bool_vars[var_id].Not() if is_negated else bool_vars[var_id]
+        return parsed
 
     def _resolve_linear_operand(
         self,
@@ -303,13 +425,15 @@ class OrToolsSolver:
             raise SolverError("Constraint operand cannot be None")
         if isinstance(operand, int):
             return operand
+        # Variable ids are the common case; look them up before paying for a failed int() parse
+        var = int_vars.get(operand)
+        if var is None:
+            var = bool_vars.get(operand)
+        if var is not None:
+            return var
         try:
             return int(operand)
         except (TypeError, ValueError):
-            if operand in int_vars:
-                return int_vars[operand]
-            if operand in bool_vars:
-                return bool_vars[operand]
             if model is not None:
                 return self._ensure_int_var(model, operand, int_vars, DEFAULT_MIN, DEFAULT_MAX)
             raise SolverError(f"Variable '{operand}' referenced before definition")
@@ -320,11 +444,12 @@ class OrToolsSolver:
         var_id: str,
         int_vars: Dict[str, cp_model.IntVar],
     ) -> cp_model.IntVar:
-        if var_id not in int_vars:
+        var = int_vars.get(var_id)
+        if var is None:
             if model is None:
                 raise SolverError(f"Integer variable '{var_id}' referenced before definition")
-            int_vars[var_id] = model.NewIntVar(DEFAULT_MIN, DEFAULT_MAX, var_id)
-        return int_vars[var_id]
+            var = int_vars[var_id] = model.new_int_var(DEFAULT_MIN, DEFAULT_MAX, var_id)
+        return var
 
     def _ensure_int_var(
         self,
@@ -334,21 +459,23 @@ class OrToolsSolver:
         min_value: int,
         max_value: int,
     ) -> cp_model.IntVar:
-        if var_id in int_vars:
-            return int_vars[var_id]
-        int_vars[var_id] = model.NewIntVar(min_value, max_value, var_id)
-        return int_vars[var_id]
+        var = int_vars.get(var_id)
+        if var is None:
+            var = int_vars[var_id] = model.new_int_var(min_value, max_value, var_id)
+        return var
 
     def _ensure_bool_var(
         self,
         model: cp_model.CpModel,
         var_id: str,
         bool_vars: Dict[str, cp_model.BoolVar],
+        literals: Dict[str, cp_model.BoolVar],
     ) -> cp_model.BoolVar:
-        if var_id in bool_vars:
-            return bool_vars[var_id]
-        bool_vars[var_id] = model.NewBoolVar(var_id)
-        return bool_vars[var_id]
+        var = bool_vars.get(var_id)
+        if var is None:
+            var = bool_vars[var_id] = literals[var_id] = model.new_bool_var(var_id)
+            literals[NEGATION_PREFIX + var_id] = var.negated()
+        return var
 
     def _get_linear_term_var(
         self,
@@ -356,11 +483,40 @@ class OrToolsSolver:
         int_vars: Dict[str, cp_model.IntVar],
         bool_vars: Dict[str, cp_model.BoolVar],
     ) -> Union[cp_model.IntVar, cp_model.BoolVar]:
-        if var_id in int_vars:
-            return int_vars[var_id]
-        if var_id in bool_vars:
-            return bool_vars[var_id]
-        raise SolverError(f"Variable '{var_id}' used in expression before definition")
+        var = int_vars.get(var_id)
+        if var is None:
+            var = bool_vars.get(var_id)
+            if var is None:
+                raise SolverError(f"Variable '{var_id}' used in expression before definition")
+        return var
+
+    @staticmethod
+    def _referenced_var_ids(
+        constraints: List[ConstraintModel],
+        intervals: List[IntervalVarModel],
+        objective: Optional[ObjectiveModel],
+    ) -> Set[str]:
+        """Collect the variable ids named by constraint operands, interval bounds and linear terms."""
+        referenced: Set[str] = set()
+        for constraint in constraints:
+            for operand in (constraint.left, constraint.right):
+                if isinstance(operand, str):
+                    referenced.add(operand)
+            for term in constraint.terms or ():
+                referenced.add(term.var)
+        for interval in intervals:
+            referenced.add(interval.start_var)
+            if interval.end_var is not None:
+                referenced.add(interval.end_var)
+        if objective is not None:
+            for term in objective.terms:
+                referenced.add(term.var)
+        return referenced
+
+    @staticmethod
+    def _fits_end_domain(start_var: cp_model.IntVar, duration: int) -> bool:
+        domain = start_var.proto.domain
+        return domain[0] >= 0 and domain[-1] <= DEFAULT_MAX - duration
 
     @staticmethod
     def _map_status(status_code: int) -> SolverStatus:
@@ -372,5 +528,3 @@ class OrToolsSolver:
             cp_model.UNKNOWN: "UNKNOWN",
         }
         return status_map.get(status_code, "UNKNOWN")
-
-
@@ -0,0 +1,100 @@
+"""Regression tests for CP-SAT model construction.
+
+Run from the solver_service directory: ``python -m unittest discover tests``.
+"""
+
+import unittest
+
+import msgspec
+
+from models import SolverConfig, SolverRequest
+from solver import OrToolsSolver
+
+
+def solve(payload: dict) -> dict:
+    request = msgspec.convert(payload, SolverRequest)
+    return OrToolsSolver(SolverConfig(max_time_seconds=5.0, num_workers=1)).solve(request)
+
+
+def intervals_by_id(result: dict) -> dict:
+    return {interval["id"]: (interval["start"], interval["end"]) for interval in result["intervals"]}
+
+
+def values_by_id(result: dict) -> dict:
+    return {var["id"]: var["value"] for var in result["variables"]}
+
+
+class ImplicitEndVariableTests(unittest.TestCase):
+    def test_interval_can_start_at_previous_interval_end(self) -> None:
+        result = solve(
+            {
+                "variables": [{"id": "x", "min": 5, "max": 100}],
+                "intervals": [
+                    {"id": "x", "start_var": "x", "duration": 3},
+                    {"id": "y", "start_var": "x_end", "duration": 3},
+                ],
+                "objective": {"type": "minimize", "terms": [{"var": "x"}]},
+            }
+        )
+
+        self.assertEqual(result["status"], "OPTIMAL")
+        self.assertEqual(intervals_by_id(result), {"x": (5, 8), "y": (8, 11)})
+
+    def test_chaining_works_when_later_interval_is_listed_first(self) -> None:
+        result = solve(
+            {
+                "variables": [{"id": "x", "min": 5, "max": 100}],
+                "intervals": [
+                    {"id": "y", "start_var": "x_end", "duration": 3},
+                    {"id": "x", "start_var": "x", "duration": 3},
+                ],
+                "objective": {"type": "minimize", "terms": [{"var": "x"}]},
+            }
+        )
+
+        self.assertEqual(result["status"], "OPTIMAL")
+        self.assertEqual(intervals_by_id(result), {"x": (5, 8), "y": (8, 11)})
+
+    def test_declared_end_variable_acts_as_deadline(self) -> None:
+        result = solve(
+            {
+                "variables": [{"id": "t", "min": 0, "max": 100}, {"id": "t_end", "min": 0, "max": 10}],
+                "intervals": [{"id": "t", "start_var": "t", "duration": 5}],
+                "objective": {"type": "maximize", "terms": [{"var": "t"}]},
+            }
+        )
+
+        self.assertEqual(result["status"], "OPTIMAL")
+        self.assertEqual(intervals_by_id(result), {"t": (5, 10)})
+        self.assertEqual(values_by_id(result)["t_end"], 10)
+
+    def test_constraint_on_implicit_end_variable(self) -> None:
+        result = solve(
+            {
+                "variables": [{"id": "t", "min": 0, "max": 100}],
+                "intervals": [{"id": "t", "start_var": "t", "duration": 5}],
+                "constraints": [{"type": "less_equal", "left": "t_end", "right": 10}],
+                "objective": {"type": "maximize", "terms": [{"var": "t"}]},
+            }
+        )
+
+        self.assertEqual(result["status"], "OPTIMAL")
+        self.assertEqual(intervals_by_id(result), {"t": (5, 10)})
+
+
+    def test_folded_bound_on_declared_end_variable_acts_as_deadline(self) -> None:
+        result = solve(
+            {
+                "variables": [{"id": "t", "min": 0, "max": 100}, {"id": "t_end", "min": 0, "max": 1000}],
+                "intervals": [{"id": "t", "start_var": "t", "duration": 5}],
+                "constraints": [{"type": "less_equal", "left": "t_end", "right": 10}],
+                "objective": {"type": "maximize", "terms": [{"var": "t"}]},
+            }
+        )
+
+        self.assertEqual(result["status"], "OPTIMAL")
+        self.assertEqual(intervals_by_id(result), {"t": (5, 10)})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+"""Process-pool entrypoints that run CP-SAT outside the event loop."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Optional
+
+import msgspec
+import orjson
+
+from models import SolverConfig, SolverRequest
+from solver import BuiltModel, OrToolsSolver
+
+# Requests bypass FastAPI's body parsing and are decoded straight into structs.
+request_decoder = msgspec.json.Decoder(SolverRequest)
+
+_solver: Optional[OrToolsSolver] = None
+# Built models keyed by the exact request body, most recently used last. Repeat
+# submissions of an unchanged schedule skip both decoding and model construction.
+_model_cache: "OrderedDict[bytes, BuiltModel]" = OrderedDict()
+_model_cache_size = 0
+
+
+def init_worker(config: SolverConfig) -> None:
+    """Pool initializer: build per-process state once instead of per request."""
+    global _solver, _model_cache_size
+    _solver = OrToolsSolver(config)
+    _model_cache_size = config.model_cache_size
+
+
+def solve_payload(body: bytes) -> bytes:
+    """Decode, solve and serialise a request; only bytes cross the process boundary.
+
+    Raises ``msgspec.DecodeError`` for malformed requests and ``SolverError``
+    for models CP-SAT cannot build.
+    """
+    if _solver is None:  # pragma: no cover - guarded by the pool initializer
+        raise RuntimeError("Solver worker has not been initialised")
+    built = _model_cache.get(body)
+    if built is None:
+        built = _solver.build(request_decoder.decode(body))
+        if _model_cache_size:
+            _model_cache[body] = built
+            if len(_model_cache) > _model_cache_size:
+                _model_cache.popitem(last=False)
+    else:
+        _model_cache.move_to_end(body)
+    return orjson.dumps(_solver.solve_built(built))